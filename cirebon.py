@@ -1,10 +1,16 @@
+import hashlib
+import marshal
 import os
 import pico
+import re
 import sys
 import time
+from collections import deque
 
-registers = {
-    'A': 0, 'B': 0, 'C': 0, 'D': 0
+registers = [0, 0, 0, 0]
+# Register name -> index into `registers`, only used while compiling.
+REG_IDX = {
+    'A': 0, 'B': 1, 'C': 2, 'D': 3
 }
 modules = {
     'task': False, 'os': False, 'utils': False
@@ -14,295 +20,500 @@ stack = []
 channels = {}
 current_channel = None
 
-flags = {
-    'EQUAL': False
-}
+equal_flag = False
+
+# Bump when the compiled instruction format changes, to invalidate .cirec files.
+CIREC_MAGIC = 4
+
+class CireSyntaxError(Exception):
+    """Raised by compile() for programs that can't be run."""
+
+# Matches the text of every line that isn't blank or a comment.
+LINE_RE = re.compile(r'(?m)^[^\S\n]*([^;\s][^\n]*)')
 
 def tokenize(code):
     tokens = []
-    lines = code.strip().split('\n')
-    for line in lines:
-        stripped_line = line.strip()
-        if stripped_line and not stripped_line.startswith(';'):
-            tokens.append(stripped_line.split())
+    line_no = 1
+    pos = 0
+    for match in LINE_RE.finditer(code):
+        line_no += code.count('\n', pos, match.start())
+        pos = match.start()
+        parts = match.group(1).split()
+        # Commands are case-insensitive, label names are not
+        if not parts[0].endswith(':'):
+            parts[0] = parts[0].lower()
+        # Interned so the compiler's dict lookups can compare by identity
+        tokens.append((line_no, [sys.intern(part) for part in parts]))
     return tokens
 
-def find_labels(tokens):
+# Returned by a handler to stop the program after an error.
+HALT = -1
+
+# Instruction handlers. A compiled instruction is a tuple whose first item is
+# its handler; the handler gets the whole tuple and returns the next ip, HALT,
+# or None to fall through to the next instruction.
+
+# The arithmetic, mov and compare handlers run in tight loops, so they bind
+# `registers` as a default argument to read it as a local instead of a global.
+def _op_mov_imm(instr, registers=registers):
+    registers[instr[1]] = instr[2]
+
+def _op_mov_reg(instr, registers=registers):
+    registers[instr[1]] = registers[instr[2]]
+
+def _op_add(instr, registers=registers):
+    registers[instr[1]] += registers[instr[2]]
+
+def _op_sub(instr, registers=registers):
+    registers[instr[1]] -= registers[instr[2]]
+
+def _op_mul(instr, registers=registers):
+    registers[instr[1]] *= registers[instr[2]]
+
+def _op_div(instr, registers=registers):
+    if registers[instr[2]] == 0:
+        print("Error: Division by zero.")
+        return HALT
+    registers[instr[1]] //= registers[instr[2]]
+
+def _op_push_reg(instr):
+    stack.append(registers[instr[1]])
+
+def _op_push_imm(instr):
+    stack.append(instr[1])
+
+def _op_pop(instr):
+    if not stack:
+        print("Error: Stack is empty.")
+        return HALT
+    registers[instr[1]] = stack.pop()
+
+def _op_chadd(instr):
+    channel_name = instr[1]
+    if channel_name not in channels:
+        channels[channel_name] = deque()
+    else:
+        print(f"Warning: Channel '{channel_name}' already exists.")
+
+def _op_chdel(instr):
+    global current_channel
+    channel_name = instr[1]
+    if channel_name in channels:
+        del channels[channel_name]
+        if current_channel == channel_name:
+            current_channel = None
+    else:
+        print(f"Error: Channel '{channel_name}' does not exist.")
+        return HALT
+
+def _op_chswitch(instr):
+    global current_channel
+    channel_name = instr[1]
+    if channel_name in channels:
+        current_channel = channel_name
+    else:
+        print(f"Error: Channel '{channel_name}' does not exist.")
+        return HALT
+
+def _op_chin_reg(instr):
+    if current_channel is None:
+        print("Error: No active channel.")
+        return HALT
+    channels[current_channel].append(registers[instr[1]])
+
+def _op_chin_const(instr):
+    if current_channel is None:
+        print("Error: No active channel.")
+        return HALT
+    channels[current_channel].append(instr[1])
+
+def _op_chout(instr):
+    if current_channel is None:
+        print("Error: No active channel.")
+        return HALT
+    if not channels[current_channel]:
+        print(f"Error: Channel '{current_channel}' is empty.")
+        return HALT
+    value = channels[current_channel].popleft()
+    print(f"--> Output from channel '{current_channel}': {value}")
+
+def _op_chmov(instr):
+    if current_channel is None:
+        print("Error: No active channel.")
+        return HALT
+    if not channels[current_channel]:
+        print(f"Error: Channel '{current_channel}' is empty.")
+        return HALT
+    registers[instr[1]] = channels[current_channel].popleft()
+
+def _op_prt_reg(instr):
+    print(f"--> Register '{instr[2]}': {registers[instr[1]]}")
+
+def _op_prt_str(instr):
+    if isinstance(instr[2], str):
+        print(f"--> String output: {instr[2]}")
+    else:
+        print(f"Error: Constant '{instr[1]}' is not a string.")
+
+def _op_cmp(instr, registers=registers):
+    global equal_flag
+    equal_flag = (registers[instr[1]] == registers[instr[2]])
+
+def _op_jmp(instr):
+    return instr[1]
+
+def _op_je(instr):
+    if equal_flag:
+        return instr[1]
+
+def _op_jne(instr):
+    if not equal_flag:
+        return instr[1]
+
+# Superinstructions built by fuse() from common instruction pairs.
+
+def _op_cmp_je(instr, registers=registers):
+    global equal_flag
+    equal_flag = (registers[instr[1]] == registers[instr[2]])
+    if equal_flag:
+        return instr[3]
+
+def _op_cmp_jne(instr, registers=registers):
+    global equal_flag
+    equal_flag = (registers[instr[1]] == registers[instr[2]])
+    if not equal_flag:
+        return instr[3]
+
+def _op_mov_imm_add(instr, registers=registers):
+    registers[instr[1]] = instr[2]
+    registers[instr[3]] += instr[2]
+
+def _op_include(instr):
+    modules[instr[1]] = True
+
+def _op_task_stop(instr):
+    if modules["task"] == True:
+        time.sleep(instr[1])
+    else:
+        print("Error: Module 'task' not included.")
+        return HALT
+
+def _op_os_system(instr):
+    if modules['os'] == True:
+        os.system(instr[1])
+    else:
+        print("Error: Module 'os' not included.")
+        return HALT
+
+def _op_utils_countto(instr):
+    countto = instr[1]
+    if modules['utils'] == True:
+        for i in range(1, countto + 1):
+            print(f"--> Counting to {countto}: {i}")
+    else:
+        print("Error: Module 'utils' not included")
+        return HALT
+
+# Minimum number of operands each command takes. Extra operands are ignored.
+ARITY = {
+    'mov': 2, 'add': 2, 'sub': 2, 'mul': 2, 'div': 2, 'cmp': 2, 'const': 2,
+    'push': 1, 'pop': 1,
+    'chadd': 1, 'chdel': 1, 'chswitch': 1, 'chin': 1, 'chout': 0, 'chmov': 1,
+    'prt_reg': 1, 'prt_str': 1,
+    'jmp': 1, 'je': 1, 'jne': 1,
+    '/include': 1, 'task.stop': 1, 'os.system': 1, 'utils.countto': 1,
+}
+
+def _reg(token):
+    reg_name = token.upper()
+    if reg_name not in REG_IDX:
+        raise CireSyntaxError(f"Unknown register '{reg_name}'.")
+    return REG_IDX[reg_name]
+
+def _compile_line(line_tokens):
+    command = line_tokens[0]
+
+    if command not in ARITY:
+        raise CireSyntaxError(f"Unknown command '{command}'")
+    if len(line_tokens) - 1 < ARITY[command]:
+        raise CireSyntaxError(f"Incomplete command '{command}'")
+
+    if command == 'mov':
+        target_reg = _reg(line_tokens[1])
+        source = line_tokens[2]
+        try:
+            return (_op_mov_imm, target_reg, int(source))
+        except ValueError:
+            pass
+        source_reg = source.upper()
+        if source_reg in REG_IDX:
+            return (_op_mov_reg, target_reg, REG_IDX[source_reg])
+        elif source in constants:
+            # Constants are already resolved, so this is a plain immediate load
+            return (_op_mov_imm, target_reg, constants[source])
+        raise CireSyntaxError(f"Unknown source '{source}'")
+
+    elif command in ('add', 'sub', 'mul', 'div', 'cmp'):
+        op = {'add': _op_add, 'sub': _op_sub, 'mul': _op_mul, 'div': _op_div, 'cmp': _op_cmp}[command]
+        return (op, _reg(line_tokens[1]), _reg(line_tokens[2]))
+
+    elif command == 'const':
+        const_name = line_tokens[1]
+        # Check if the value is a string (starts with " and ends with ")
+        if line_tokens[2].startswith('"') and line_tokens[-1].endswith('"'):
+            constants[const_name] = ' '.join(line_tokens[2:]).strip('"')
+        else:
+            try:
+                constants[const_name] = int(line_tokens[2])
+            except ValueError:
+                raise CireSyntaxError("Constant value must be an integer or a string.") from None
+        # Constants are substituted at compile time and emit no code
+        return None
+
+    elif command == 'push':
+        source = line_tokens[1]
+        source_reg = source.upper()
+        if source_reg in REG_IDX:
+            return (_op_push_reg, REG_IDX[source_reg])
+        try:
+            return (_op_push_imm, int(source))
+        except ValueError:
+            raise CireSyntaxError(f"Unknown source '{source}'.") from None
+
+    elif command in ('pop', 'chmov'):
+        op = _op_pop if command == 'pop' else _op_chmov
+        return (op, _reg(line_tokens[1]))
+
+    elif command in ('chadd', 'chdel', 'chswitch'):
+        op = {'chadd': _op_chadd, 'chdel': _op_chdel, 'chswitch': _op_chswitch}[command]
+        return (op, line_tokens[1])
+
+    elif command == 'chin':
+        source = line_tokens[1]
+        source_reg = source.upper()
+        if source_reg in REG_IDX:
+            return (_op_chin_reg, REG_IDX[source_reg])
+        elif source in constants:
+            return (_op_chin_const, constants[source])
+        raise CireSyntaxError(f"Unknown source '{source}'.")
+
+    elif command == 'chout':
+        return (_op_chout,)
+
+    elif command == 'prt_reg':
+        reg_idx = _reg(line_tokens[1])
+        return (_op_prt_reg, reg_idx, line_tokens[1].upper())
+
+    elif command == 'prt_str':
+        const_name = line_tokens[1]
+        return (_op_prt_str, const_name, constants.get(const_name))
+
+    elif command in ('jmp', 'je', 'jne'):
+        # The label is resolved by compile() once all labels are known
+        op = {'jmp': _op_jmp, 'je': _op_je, 'jne': _op_jne}[command]
+        return (op, line_tokens[1])
+
+    elif command == '/include':
+        module = line_tokens[1]
+        if module == 'pico':
+            raise CireSyntaxError("The 'pico' module is in development and can't be used.")
+        elif module not in modules:
+            raise CireSyntaxError(f"Unknown module '{module}'")
+        return (_op_include, module)
+
+    elif command == 'task.stop':
+        try:
+            return (_op_task_stop, float(line_tokens[1]))
+        except ValueError:
+            raise CireSyntaxError("Time must be integer or float.") from None
+
+    elif command == 'os.system':
+        return (_op_os_system, line_tokens[1])
+
+    elif command == 'utils.countto':
+        try:
+            return (_op_utils_countto, int(line_tokens[1]))
+        except ValueError:
+            raise CireSyntaxError("Number to count must be an integer") from None
+
+def compile(tokens):
+    """Lowers tokenized lines to a flat list of (handler, *operands) tuples.
+
+    Registers, immediates, constants and jump targets are resolved and every
+    line is validated here, once, so that execute() never has to look at a
+    source token. Labels are collected in the same pass and jumps are patched
+    once the whole program has been seen. Raises CireSyntaxError, with the line
+    number, for lines that can't be compiled.
+    """
+    code = []
     labels = {}
-    for i, line_tokens in enumerate(tokens):
+    jumps = []
+    for line_no, line_tokens in tokens:
         if line_tokens[0].endswith(':'):
-            label_name = line_tokens[0][:-1]
-            labels[label_name] = i
-    return labels
+            # Labels emit no code, they point at the next instruction
+            labels[sys.intern(line_tokens[0][:-1])] = len(code)
+            continue
+        try:
+            instr = _compile_line(line_tokens)
+        except CireSyntaxError as e:
+            raise CireSyntaxError(f"Line {line_no}: {e}") from None
+        if instr is None:
+            continue
+        if instr[0] in (_op_jmp, _op_je, _op_jne):
+            jumps.append((len(code), line_no))
+        code.append(instr)
 
-def execute(tokens, labels):
-    global registers, constants, stack, channels, current_channel, flags
-    
-    ip = 0
-    while ip < len(tokens):
-        line_tokens = tokens[ip]
-        command = line_tokens[0].lower()
+    for ip, line_no in jumps:
+        op, label = code[ip]
+        if label not in labels:
+            raise CireSyntaxError(f"Line {line_no}: Unknown label '{label}'.")
+        code[ip] = (op, labels[label])
+    return fuse(code)
 
-        try:
-            if command.endswith(':'):
-                ip += 1
+def _fuse_pair(first, second):
+    if first[0] is _op_cmp and second[0] is _op_je:
+        return (_op_cmp_je, first[1], first[2], second[1])
+    if first[0] is _op_cmp and second[0] is _op_jne:
+        return (_op_cmp_jne, first[1], first[2], second[1])
+    if first[0] is _op_mov_imm and second[0] is _op_add and second[2] == first[1]:
+        return (_op_mov_imm_add, first[1], first[2], second[1])
+    return None
+
+def fuse(code):
+    """Folds common instruction pairs into single superinstructions.
+
+    `cmp` followed by `je`/`jne` and `mov X <value>` followed by `add Y X`
+    become one instruction each, so they are dispatched once. A pair is left
+    alone if something jumps to its second half. Jump targets are remapped to
+    the shortened code.
+    """
+    targets = set()
+    for instr in code:
+        if instr[0] in (_op_jmp, _op_je, _op_jne):
+            targets.add(instr[1])
+
+    fused = []
+    new_ip = []
+    ip = 0
+    while ip < len(code):
+        new_ip.append(len(fused))
+        if ip + 1 < len(code) and ip + 1 not in targets:
+            super_instr = _fuse_pair(code[ip], code[ip + 1])
+            if super_instr is not None:
+                new_ip.append(len(fused))
+                fused.append(super_instr)
+                ip += 2
                 continue
+        fused.append(code[ip])
+        ip += 1
+    # A label at the very end of the program jumps past the last instruction
+    new_ip.append(len(fused))
 
-            elif command == 'mov':
-                target_reg = line_tokens[1].upper()
-                source = line_tokens[2]
-                
-                if source.isdigit() or (source.startswith('-') and source[1:].isdigit()):
-                    registers[target_reg] = int(source)
-                elif source.upper() in registers:
-                    registers[target_reg] = registers[source.upper()]
-                elif source in constants:
-                    registers[target_reg] = constants[source]
-                else:
-                    print(f"Error: Unknown source '{source}'")
-                    break
-
-            elif command == 'add':
-                target_reg = line_tokens[1].upper()
-                source_reg = line_tokens[2].upper()
-                registers[target_reg] += registers[source_reg]
-
-            elif command == 'sub':
-                target_reg = line_tokens[1].upper()
-                source_reg = line_tokens[2].upper()
-                registers[target_reg] -= registers[source_reg]
-
-            elif command == 'mul':
-                target_reg = line_tokens[1].upper()
-                source_reg = line_tokens[2].upper()
-                registers[target_reg] *= registers[source_reg]
-
-            elif command == 'div':
-                target_reg = line_tokens[1].upper()
-                source_reg = line_tokens[2].upper()
-                if registers[source_reg] == 0:
-                    print("Error: Division by zero.")
-                    break
-                registers[target_reg] //= registers[source_reg]
-
-            elif command == 'const':
-                const_name = line_tokens[1]
-                # Check if the value is a string (starts with " and ends with ")
-                if line_tokens[2].startswith('"') and line_tokens[-1].endswith('"'):
-                    value = ' '.join(line_tokens[2:]).strip('"')
-                    constants[const_name] = value
-                else:
-                    value = int(line_tokens[2])
-                    constants[const_name] = value
-
-            elif command == 'push':
-                source = line_tokens[1]
-                if source.upper() in registers:
-                    stack.append(registers[source.upper()])
-                else:
-                    stack.append(int(source))
-
-            elif command == 'pop':
-                target_reg = line_tokens[1].upper()
-                if not stack:
-                    print("Error: Stack is empty.")
-                    break
-                registers[target_reg] = stack.pop()
-            
-            elif command == 'chadd':
-                channel_name = line_tokens[1]
-                if channel_name not in channels:
-                    channels[channel_name] = []
-                else:
-                    print(f"Warning: Channel '{channel_name}' already exists.")
-
-            elif command == 'chdel':
-                channel_name = line_tokens[1]
-                if channel_name in channels:
-                    del channels[channel_name]
-                    if current_channel == channel_name:
-                        current_channel = None
-                else:
-                    print(f"Error: Channel '{channel_name}' does not exist.")
-                    break
-
-            elif command == 'chswitch':
-                channel_name = line_tokens[1]
-                if channel_name in channels:
-                    current_channel = channel_name
-                else:
-                    print(f"Error: Channel '{channel_name}' does not exist.")
-                    break
-
-            elif command == 'chin':
-                if current_channel is None:
-                    print("Error: No active channel.")
-                    break
-                source = line_tokens[1]
-                if source.upper() in registers:
-                    channels[current_channel].append(registers[source.upper()])
-                elif source in constants:
-                    channels[current_channel].append(constants[source])
-                else:
-                    print(f"Error: Unknown source '{source}'.")
-                    break
-
-            elif command == 'chout':
-                if current_channel is None:
-                    print("Error: No active channel.")
-                    break
-                if not channels[current_channel]:
-                    print(f"Error: Channel '{current_channel}' is empty.")
-                    break
-                value = channels[current_channel].pop(0)
-                print(f"--> Output from channel '{current_channel}': {value}")
-
-            elif command == 'chmov':
-                if current_channel is None:
-                    print("Error: No active channel.")
-                    break
-                if not channels[current_channel]:
-                    print(f"Error: Channel '{current_channel}' is empty.")
-                    break
-                target_reg = line_tokens[1].upper()
-                value = channels[current_channel].pop(0)
-                registers[target_reg] = value
-            
-            elif command == 'prt_reg':
-                reg_name = line_tokens[1].upper()
-                if reg_name in registers:
-                    print(f"--> Register '{reg_name}': {registers[reg_name]}")
-                else:
-                    print(f"Error: Unknown register '{reg_name}'.")
-                    break
-            
-            elif command == 'prt_str':
-                const_name = line_tokens[1]
-                if const_name in constants and isinstance(constants[const_name], str):
-                    print(f"--> String output: {constants[const_name]}")
-                else:
-                    print(f"Error: Constant '{const_name}' is not a string.")
-
-            elif command == 'cmp':
-                reg1 = line_tokens[1].upper()
-                reg2 = line_tokens[2].upper()
-                flags['EQUAL'] = (registers[reg1] == registers[reg2])
-                
-            elif command == 'jmp':
-                label = line_tokens[1]
-                if label in labels:
-                    ip = labels[label]
-                else:
-                    print(f"Error: Unknown label '{label}'.")
-                    break
-            
-            elif command == 'je':
-                label = line_tokens[1]
-                if flags['EQUAL']:
-                    if label in labels:
-                        ip = labels[label]
-                    else:
-                        print(f"Error: Unknown label '{label}'.")
-                        break
-            
-            elif command == 'jne':
-                label = line_tokens[1]
-                if not flags['EQUAL']:
-                    if label in labels:
-                        ip = labels[label]
-                    else:
-                        print(f"Error: Unknown label '{label}'.")
-                        break
-
-            elif command == '/include':
-                module = line_tokens[1]
-                if module == 'task':
-                    modules['task'] = True
-                elif module == 'pico':
-                    print("Error: The 'pico' module is in development and can't be used.")
-                    break
-                elif module == 'os':
-                    modules['os'] = True
-                elif module == 'utils':
-                    modules['utils'] = True
-                else:
-                    print(f"Error: Unknown module '{module}'")
-                    break
-
-            elif command == 'task.stop':
-                time_to_wait = line_tokens[1]
-                try:
-                    if modules["task"] == True:
-                        time.sleep(time_to_wait)
-                    else:
-                        print("Error: Module 'task' not included.")
-                        break
-                except ValueError:
-                    print("Error: Time must be integer or float.")
-                    break
-
-            elif command == 'os.system':
-                commandline = line_tokens[1]
-                if modules['os'] == True:
-                    os.system(commandline)
-                else:
-                    print("Error: Module 'os' not included.")
-                    break
-
-            elif command == 'utils.countto':
-                countto = line_tokens[1]
-                try:
-                    if modules['utils'] == True:
-                        for i in range(1, countto + 1):
-                            print(f"--> Counting to {countto}: {i}")
-                    else:
-                        print("Error: Module 'utils' not included")
-                        break
-                except ValueError:
-                    print("Error: Number to count must be an integer")
-            
-            else:
-                print(f"Error: Unknown command '{command}'")
+    for ip, instr in enumerate(fused):
+        if instr[0] in (_op_jmp, _op_je, _op_jne):
+            fused[ip] = (instr[0], new_ip[instr[1]])
+        elif instr[0] in (_op_cmp_je, _op_cmp_jne):
+            fused[ip] = instr[:3] + (new_ip[instr[3]],)
+    return fused
+
+def _load_cache(file_path, source_hash):
+    """Loads the compiled program from the .cirec file next to the source.
+
+    Returns None if there is no cache, it was built from different source or
+    it is malformed.
+    """
+    try:
+        with open(file_path + 'c', 'rb') as f:
+            magic, cached_hash, cached_code = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if magic != CIREC_MAGIC or cached_hash != source_hash:
+        return None
+    code = []
+    try:
+        for instr in cached_code:
+            handler = globals().get(instr[0]) if instr[0].startswith('_op_') else None
+            if handler is None:
+                return None
+            code.append((handler,) + instr[1:])
+    except (TypeError, AttributeError, IndexError):
+        return None
+    return code
+
+def _save_cache(file_path, source_hash, code):
+    """Saves the compiled program to a .cirec file next to the source.
+
+    Like a .pyc write, failing to save is not an error; the program just gets
+    compiled again next time.
+    """
+    # Handlers are stored by name, marshal can't serialize functions
+    cached_code = [(instr[0].__name__,) + instr[1:] for instr in code]
+    try:
+        with open(file_path + 'c', 'wb') as f:
+            marshal.dump((CIREC_MAGIC, source_hash, cached_code), f)
+    except OSError:
+        pass
+
+def execute(code):
+    n = len(code)
+    ip = 0
+    try:
+        while ip < n:
+            instr = code[ip]
+            new_ip = instr[0](instr)
+            if new_ip is None:
+                ip += 1
+            elif new_ip == HALT:
                 break
+            else:
+                ip = new_ip
+    except Exception as e:
+        print(f"An execution error occurred: {e}")
 
-            ip += 1
+# Shell commands. A handler returns True to leave the shell.
 
-        except IndexError:
-            print(f"Error: Incomplete command '{command}'")
-            break
-        except KeyError as e:
-            print(f"Error: Unknown register, constant, or channel: {e}")
-            break
-        except Exception as e:
-            print(f"An execution error occurred: {e}")
-            break
+def _repl_quit():
+    return True
+
+def _repl_echo():
+    echoinput = input("echo >>> ")
+    print(f"--> String output: {echoinput}")
+
+def _repl_help():
+    print("**********************************")
+    print("Help:")
+    print("q/quit/exit     exit cirebon shell")
+    print("help/helpme/h   display this menu")
+    print("echo            put string")
+    print("pico            enter Pico")
+    print("**********************************")
+    print("Cirebon 1.3                Testing")
+    print("MIT License")
+    print("Copyright (c) 2025 48Hz")
+    print("**********************************")
+    print("Say Hi!                         :D")
+
+def _repl_unknown():
+    print("Error: Invalid command.\nUse 'help', 'helpme' or 'h' to get help.")
+
+REPL = {
+    'q': _repl_quit,
+    'quit': _repl_quit,
+    'exit': _repl_quit,
+    'echo': _repl_echo,
+    'pico': pico.mode,
+    'help': _repl_help,
+    'helpme': _repl_help,
+    'h': _repl_help,
+}
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         while True:
             terminput = input("Cirebon >>> ")
-            if terminput == "q" or terminput == "quit" or terminput == "exit":
+            handler = REPL.get(terminput, _repl_unknown)
+            if handler():
                 break
-            elif terminput == "echo":
-                echoinput = input("echo >>> ")
-                print(f"--> String output: {echoinput}")
-            elif terminput == "pico":
-                pico.mode()
-            elif terminput == "help" or terminput == "helpme" or terminput == "h":
-                print("**********************************")
-                print("Help:")
-                print("q/quit/exit     exit cirebon shell")
-                print("help/helpme/h   display this menu")
-                print("echo            put string")
-                print("pico            enter Pico")
-                print("**********************************")
-                print("Cirebon 1.3                Testing")
-                print("MIT License")
-                print("Copyright (c) 2025 48Hz")
-                print("**********************************")
-                print("Say Hi!                         :D")
-            else:
-                print("Error: Invalid command.\nUse 'help', 'helpme' or 'h' to get help.")
     else:
         file_path = sys.argv[1]
         if not file_path.endswith('.cire'):
@@ -312,10 +523,16 @@ if __name__ == "__main__":
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
                 code = file.read()
+            source_hash = hashlib.sha1(code.encode('utf-8')).hexdigest()
+            program = _load_cache(file_path, source_hash)
+            if program is None:
                 tokens = tokenize(code)
-                labels = find_labels(tokens)
-                execute(tokens, labels)
+                program = compile(tokens)
+                _save_cache(file_path, source_hash, program)
+            execute(program)
         except FileNotFoundError:
             print(f"Error: File '{file_path}' not found.")
+        except CireSyntaxError as e:
+            print(f"Error: {e}")
         except Exception as e:
             print(f"An error occurred while reading or executing: {e}")
@@ -8,13 +8,20 @@ import base64
 
 # Base URL for GitHub API
 GITHUB_API_URL = "https://api.github.com"
+# Home directory where pico keeps its config files
+HOME_DIR = os.path.expanduser('~')
 # Path to the file where the token will be stored
-TOKEN_FILE = os.path.join(os.path.expanduser('~'), '.cirebon_token')
+TOKEN_FILE = os.path.join(HOME_DIR, '.cirebon_token')
 # Path to the file where the current repository name is stored
-REPO_CONFIG_FILE = os.path.join(os.path.expanduser('~'), '.cirebon_repo')
+REPO_CONFIG_FILE = os.path.join(HOME_DIR, '.cirebon_repo')
 
 # Placeholder for the repository name
 _current_repo = None 
+# Auth headers built from the token file, cached until the token changes
+_cached_headers = None
+# Shared session, so API calls reuse one keep-alive connection to GitHub
+_session = requests.Session()
+_session.headers.update({"Accept": "application/vnd.github.v3+json"})
 
 # --- Helper functions ---
 
@@ -57,12 +64,15 @@ def _get_token():
 
 def _get_auth_headers():
     """Returns headers for GitHub API authentication."""
+    global _cached_headers
+    if _cached_headers:
+        return _cached_headers
     token = _get_token()
     if token:
-        return {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
+        _cached_headers = {
+            "Authorization": f"token {token}"
         }
+        return _cached_headers
     return None
 
 def _get_repo_owner():
@@ -71,7 +81,7 @@ def _get_repo_owner():
     if not headers:
         return None
     try:
-        response = requests.get(f"{GITHUB_API_URL}/user", headers=headers)
+        response = _session.get(f"{GITHUB_API_URL}/user", headers=headers)
         response.raise_for_status()
         user_data = response.json()
         return user_data.get('login')
@@ -105,6 +115,7 @@ def handle_pico_command(command, args):
 
 def auth(args):
     """Saves the GitHub token to a local file."""
+    global _cached_headers
     if not args:
         print("Error: 'auth' requires a key.")
         return
@@ -113,12 +124,14 @@ def auth(args):
     try:
         with open(TOKEN_FILE, 'w') as f:
             f.write(key)
+        _cached_headers = None
         print("Success: Token saved successfully.")
     except Exception as e:
         print(f"Error: Failed to save token: {e}")
 
 def logdown(args):
     """Deletes the token from the file for security."""
+    global _cached_headers
     if not args:
         print("Error: 'logdown' requires a key.")
         return
@@ -129,6 +142,7 @@ def logdown(args):
     if stored_token and key_to_check == stored_token:
         try:
             os.remove(TOKEN_FILE)
+            _cached_headers = None
             if os.path.exists(REPO_CONFIG_FILE):
                 os.remove(REPO_CONFIG_FILE)
             print("Success: Token has been removed.")
@@ -163,7 +177,7 @@ def upload(args):
     owner, repo = _current_repo.split('/')
     upload_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{file_to_upload}"
     try:
-        response = requests.get(upload_url, headers=headers)
+        response = _session.get(upload_url, headers=headers)
         sha = None
         if response.status_code == 200:
             sha = response.json().get('sha')
@@ -173,7 +187,7 @@ def upload(args):
         }
         if sha:
             payload["sha"] = sha
-        response = requests.put(upload_url, headers=headers, data=json.dumps(payload))
+        response = _session.put(upload_url, headers=headers, data=json.dumps(payload))
         response.raise_for_status()
         print(f"Success: File '{file_to_upload}' uploaded to '{_current_repo}'.")
     except requests.exceptions.RequestException as e:
@@ -195,7 +209,7 @@ def download(args):
     if not headers:
         return
     try:
-        response = requests.get(download_url, headers=headers)
+        response = _session.get(download_url, headers=headers)
         response.raise_for_status()
         content = response.json().get('content')
         if not content:
@@ -233,7 +247,7 @@ def repo(args):
         payload = {"name": repo_name, "private": False}
         print(f"Creating new repository '{repo_name}'...")
         try:
-            response = requests.post(f"{GITHUB_API_URL}/user/repos", headers=headers, data=json.dumps(payload))
+            response = _session.post(f"{GITHUB_API_URL}/user/repos", headers=headers, data=json.dumps(payload))
             response.raise_for_status()
             print(f"Success: Repository '{repo_name}' created.")
             _current_repo = f"{owner}/{repo_name}"
@@ -251,6 +265,55 @@ def repo(args):
         else:
             print("Error: Could not determine user owner to set repository.")
 
+def _delete_in_one_commit(owner, repo, headers, files):
+    """Deletes files with a single commit through the Git Data API."""
+    repo_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}"
+    response = _session.get(repo_url, headers=headers)
+    response.raise_for_status()
+    ref_url = f"{repo_url}/git/refs/heads/{response.json()['default_branch']}"
+    response = _session.get(ref_url, headers=headers)
+    response.raise_for_status()
+    parent_sha = response.json()['object']['sha']
+    response = _session.get(f"{repo_url}/git/commits/{parent_sha}", headers=headers)
+    response.raise_for_status()
+    base_tree = response.json()['tree']['sha']
+    # A null sha removes the path from the base tree
+    payload = {
+        "base_tree": base_tree,
+        "tree": [
+            {"path": file_info['path'], "mode": "100644", "type": "blob", "sha": None}
+            for file_info in files
+        ]
+    }
+    response = _session.post(f"{repo_url}/git/trees", headers=headers, data=json.dumps(payload))
+    response.raise_for_status()
+    payload = {
+        "message": f"Delete {len(files)} .cire files",
+        "tree": response.json()['sha'],
+        "parents": [parent_sha]
+    }
+    response = _session.post(f"{repo_url}/git/commits", headers=headers, data=json.dumps(payload))
+    response.raise_for_status()
+    payload = {"sha": response.json()['sha']}
+    response = _session.patch(ref_url, headers=headers, data=json.dumps(payload))
+    response.raise_for_status()
+    for file_info in files:
+        print(f"Success: File '{file_info['name']}' deleted.")
+
+def _delete_one_by_one(headers, files):
+    """Deletes files with one Contents API request per file."""
+    # Kept sequential: every delete commits on top of the branch head, so
+    # concurrent requests race each other and GitHub rejects them with 409.
+    for file_info in files:
+        file_name = file_info['name']
+        payload = {
+            "message": f"Delete {file_name}",
+            "sha": file_info['sha']
+        }
+        response = _session.delete(file_info['url'], headers=headers, data=json.dumps(payload))
+        response.raise_for_status()
+        print(f"Success: File '{file_name}' deleted.")
+
 def rm(args):
     """Deletes files from the repository."""
     global _current_repo
@@ -271,7 +334,7 @@ def rm(args):
             return
         check_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{file_to_delete}"
         try:
-            response = requests.get(check_url, headers=headers)
+            response = _session.get(check_url, headers=headers)
             response.raise_for_status()
             sha = response.json().get('sha')
             payload = {
@@ -279,7 +342,7 @@ def rm(args):
                 "sha": sha
             }
             delete_url = check_url
-            response = requests.delete(delete_url, headers=headers, data=json.dumps(payload))
+            response = _session.delete(delete_url, headers=headers, data=json.dumps(payload))
             response.raise_for_status()
             print(f"Success: File '{file_to_delete}' deleted.")
         except requests.exceptions.HTTPError as e:
@@ -292,21 +355,15 @@ def rm(args):
     elif args[0] == '--all':
         list_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents"
         try:
-            response = requests.get(list_url, headers=headers)
+            response = _session.get(list_url, headers=headers)
             response.raise_for_status()
-            files = response.json()
-            for file_info in files:
-                if file_info['name'].endswith('.cire'):
-                    file_name = file_info['name']
-                    sha = file_info['sha']
-                    payload = {
-                        "message": f"Delete {file_name}",
-                        "sha": sha
-                    }
-                    delete_url = file_info['url']
-                    response = requests.delete(delete_url, headers=headers, data=json.dumps(payload))
-                    response.raise_for_status()
-                    print(f"Success: File '{file_name}' deleted.")
+            files = [file_info for file_info in response.json() if file_info['name'].endswith('.cire')]
+            if files:
+                try:
+                    _delete_in_one_commit(owner, repo, headers, files)
+                except (requests.exceptions.RequestException, KeyError, TypeError) as e:
+                    print(f"Warning: Failed to delete files in one commit, deleting one by one. {e}")
+                    _delete_one_by_one(headers, files)
             print("Success: All .cire files have been deleted.")
         except requests.exceptions.RequestException as e:
             print(f"Error: Failed to delete all files. {e}")